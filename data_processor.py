@@ -2,24 +2,47 @@
 This is a work in progress
 """
 
+import os
+
 import pandas as pd
-from ydata_profiling import ProfileReport
 
 FILE_PATH = "./data/raw/hockey_teams_raw.csv"
+USE_COLUMNS = ["team_name", "year", "wins", "losses", "ot_losses",
+               "win_pct", "goals_for", "goals_against"]
+# The counts are at most a few hundred per season, so the narrowest integer types are used;
+# win_pct stays float64 so its values are written back to the processed CSV unchanged
+COLUMN_DTYPES = {
+    "team_name": "category",
+    "year": "category",
+    "wins": "int16",
+    "losses": "int16",
+    "ot_losses": "float64",
+    "win_pct": "float64",
+    "goals_for": "int16",
+    "goals_against": "int16"
+}
 
-# Import & perform necessary transformation in the dataframe
+# Import the data with the multithreaded pyarrow parser & fill the overtime losses
+# missing from data scraped before they were recorded as 0; ot_losses is read as
+# float64 so its missing values survive the read and can be filled afterwards
 hockey_df = (
-    pd.read_csv(FILE_PATH, index_col=False)
-    .pipe(lambda x: x.drop(columns=["scrape_timestamp", "goals_diff"]))
-    .pipe(lambda x: x.fillna(0) if "ot_losses" in x.columns else x)
-    .pipe(lambda x: x.astype({"ot_losses": int, "year": str}))
+    pd.read_csv(FILE_PATH, engine="pyarrow",
+                usecols=USE_COLUMNS, dtype=COLUMN_DTYPES)
+    .fillna({"ot_losses": 0})
+    .astype({"ot_losses": "int8"})
 )
 
-# Generate Automated EDA Report with ydata Profiling library
-profile = ProfileReport(hockey_df, explorative=True,
-                        title="Hockey Team Stats - Data Profile Report")
-profile.to_file("./reports/data_profiling_report.html")
+# Generate Automated EDA Report with ydata Profiling library, only when requested
+# through the PROFILE environment variable as it is the heaviest step of the pipeline
+if os.environ.get("PROFILE"):
+    from ydata_profiling import ProfileReport
+
+    profile = ProfileReport(hockey_df, minimal=True,
+                            correlations=None, interactions=None, samples=None,
+                            title="Hockey Team Stats - Data Profile Report")
+    profile.to_file("./reports/data_profiling_report.html")
+    del profile
 
 # Export clean data
 OUTPUT_FILE_PATH = "./data/processed/hockey_team_stats.csv"
-hockey_df.to_csv(OUTPUT_FILE_PATH, index=False)
+hockey_df.to_csv(OUTPUT_FILE_PATH, index=False, chunksize=50_000)
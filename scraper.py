@@ -7,40 +7,42 @@ Email: quantumudit@gmail.com
 
 This module provides functionality to scrape hockey team statistics from a web page,
 parse the data, and write it to a CSV file. It includes the data class "Hockey" to
-represent hockey team statistics, functions to fetch data, find the URL of the next page,
-and recursively scrape and write statistics to a CSV file.
+represent hockey team statistics, functions to fetch data, find the total number of pages,
+and concurrently scrape and write statistics to a CSV file.
 
 
 Functions:
 ----------
 1. fetch_hockey_stats(): Fetches and extracts hockey team statistics from a web page.
-2. get_next_page_url(): Finds and returns the URL of the next page based on the current page URL.
-3. scrape_and_write_stats(): Scrapes and writes hockey team statistics to a CSV file.
+2. get_page_count(): Finds and returns the total number of pages from a parsed page.
+3. scrape_and_write_stats(): Concurrently scrapes and writes hockey team statistics to a CSV file.
 """
 
 # Import necessary libraries
+import asyncio
 import os
-from csv import DictWriter
-from dataclasses import asdict, dataclass, fields
+import re
+from csv import writer
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, List, Optional
-from urllib.parse import urljoin
+from typing import Any, List, Optional, Tuple
 
 import httpx
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 
 
 @dataclass
 class Hockey:
     """
-    A data class representing hockey team statistics.
+    A data class representing hockey team statistics. Its fields define the
+    column order of the scraped rows and the header of the CSV file.
 
     Attributes:
         team_name: The name of the hockey team.
         year: The year for the statistics.
         wins: The number of games won.
         losses: The number of games lost.
-        ot_losses: The number of overtime losses.
+        ot_losses: The number of overtime losses (0 for seasons where none are listed).
         win_pct: The winning percentage.
         goals_for: The total number of goals scored by the team.
         goals_against: The total number of goals conceded by the team.
@@ -49,13 +51,13 @@ class Hockey:
     """
     team_name: str
     year: str
-    wins: str
-    losses: str
-    ot_losses: str
-    win_pct: str
-    goals_for: str
-    goals_against: str
-    goals_diff: str
+    wins: int
+    losses: int
+    ot_losses: int
+    win_pct: float
+    goals_for: int
+    goals_against: int
+    goals_diff: int
     scrape_timestamp: str
 
 
@@ -64,104 +66,125 @@ ROOT_URL = "https://www.scrapethissite.com/"
 USER_AGENT = "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/117.0"
 HEADERS = {"User-Agent": USER_AGENT, "accept-language": "en-US"}
 TIMEOUT = 100
+PAGE_URL_TEMPLATE = ROOT_URL + "pages/forms/?page_num={}&per_page=100"
+PAGE_NUM_PATTERN = re.compile(r"page_num=(\d+)")
+TEAM_ROWS_SELECTOR = "div#page table tbody tr.team"
+TEAM_CELLS_SELECTOR = "td"
+PAGINATION_LINKS_SELECTOR = "ul.pagination li a"
+MAX_CONCURRENT_REQUESTS = 20
+LIMITS = httpx.Limits(max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                      max_connections=MAX_CONCURRENT_REQUESTS)
 
 # ========== Utility Functions ========== #
 
 
-def fetch_hockey_stats(page_url: str) -> List[Dict]:
+async def fetch_hockey_stats(
+        client: httpx.AsyncClient, page_url: str,
+        semaphore: asyncio.Semaphore) -> Tuple[List[tuple], LexborHTMLParser]:
     """
     Fetches hockey team statistics by sending an HTTP GET request
-    to the page URL and parsing the HTML content.
+    to the page URL and parsing the HTML content. The parsed HTML is returned
+    alongside the statistics so that callers can inspect it without re-fetching.
 
     Args:
+        client (httpx.AsyncClient): The HTTP client used to send the request.
         page_url (str): The URL of the web page containing the hockey team statistics.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
 
     Returns:
-        List[Dict]: A list of dictionaries, each representing the statistics of a hockey team.
+        Tuple[List[tuple], LexborHTMLParser]: A list of tuples, each representing
+        the statistics of a hockey team in the column order and types of "Hockey",
+        and the parsed HTML of the page.
     """
-    # Send an HTTP GET request to the page URL and parse the HTML content.
-    response = httpx.get(page_url, headers=HEADERS, timeout=TIMEOUT)
-    parsed_html = HTMLParser(response.text)
+    # Send an HTTP GET request to the page URL and parse the raw HTML bytes,
+    # without decoding the response body to a string first.
+    async with semaphore:
+        response = await client.get(page_url)
+    # Fail on error responses (e.g. throttling) instead of silently yielding no rows.
+    response.raise_for_status()
+    parsed_html = LexborHTMLParser(response.content)
 
     hockey_stats = []
+    scrape_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Extract statistics for each hockey team from the HTML table.
-    all_rows = parsed_html.css("div#page table tbody tr.team")
+    # Each row has a fixed shape, so the cells are read positionally in a single lookup.
+    all_rows = parsed_html.css(TEAM_ROWS_SELECTOR)
     for row in all_rows:
-        team_stats = Hockey(
-            team_name=row.css_first("td.name").text().strip(),
-            year=row.css_first("td.year").text().strip(),
-            wins=row.css_first("td.wins").text().strip(),
-            losses=row.css_first("td.losses").text().strip(),
-            ot_losses=row.css_first("td.ot-losses").text().strip(),
-            win_pct=row.css_first("td.pct").text().strip(),
-            goals_for=row.css_first("td.gf").text().strip(),
-            goals_against=row.css_first("td.ga").text().strip(),
-            goals_diff=row.css_first("td.diff").text().strip(),
-            scrape_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        )
-
-        hockey_stats.append(asdict(team_stats))
-    return hockey_stats
-
-
-def get_next_page_url(current_page_url: str) -> Optional[str]:
+        (team_name, year, wins, losses, ot_losses, win_pct,
+         goals_for, goals_against, goals_diff) = [
+            cell.text(strip=True) for cell in row.css(TEAM_CELLS_SELECTOR)]
+
+        # Cast the numeric cells right away so the raw data is already typed.
+        hockey_stats.append((
+            team_name, year, int(wins), int(losses), int(ot_losses or 0), float(win_pct),
+            int(goals_for), int(goals_against), int(goals_diff), scrape_timestamp
+        ))
+    return hockey_stats, parsed_html
+
+
+def get_page_count(parsed_html: LexborHTMLParser) -> int:
     """
-    Find and return the URL of the next page based on the current page URL by
-    parsing the HTML content. Returns the URL if found; otherwise, returns None.
+    Find and return the total number of pages by parsing the pagination section
+    of an already parsed page. Returns 1 if no pagination links are found.
 
     Args:
-        current_page_url (str): The URL of the current page.
+        parsed_html (LexborHTMLParser): The parsed HTML content of a page.
 
     Returns:
-        Optional[str]: The URL of the next page, or None if no next page is found.
+        int: The total number of pages.
     """
-    # Send an HTTP GET request to the current page URL and parse the HTML content.
-    response = httpx.get(current_page_url, headers=HEADERS, timeout=TIMEOUT)
-    parsed_html = HTMLParser(response.text)
-    try:
-        # Find and extract the URL of the next page element from the pagination section.
-        next_page_element = parsed_html.css_first(
-            "ul.pagination li a[aria-label='Next']").attrs["href"]
-        next_page_url = urljoin(ROOT_URL, next_page_element)
-        return next_page_url
-    except AttributeError:
-        # If no 'Next' page link is found, return None
-        return None
-
-
-def scrape_and_write_stats(start_page_url: str, csv_object: DictWriter) -> Optional[str]:
+    # Pick the highest "page_num" query parameter linked from the pagination section.
+    page_numbers = [
+        int(match.group(1))
+        for link in parsed_html.css(PAGINATION_LINKS_SELECTOR)
+        if (match := PAGE_NUM_PATTERN.search(link.attributes.get("href") or ""))
+    ]
+    return max(page_numbers, default=1)
+
+
+async def scrape_and_write_stats(csv_object: Any) -> Optional[str]:
     """
-    Recursively scrape and write hockey team statistics to a CSV file from a series of web pages.
+    Concurrently scrape and write hockey team statistics to a CSV file from all the web pages.
 
     Args:
-        start_page_url (str): The URL of the starting page to begin the scraping.
-        csv_writer (csv.DictWriter): The CSV writer to write the extracted data.
+        csv_object (csv.writer): The CSV writer to write the extracted data.
 
     Returns:
         Optional[str]: A message indicating the HTTP error in the scraping process.
     """
-    try:
-        # Fetch hockey team statistics from the current page.
-        hockey_team_stats = fetch_hockey_stats(page_url=start_page_url)
-
-        # Find the URL of the next page, if available.
-        next_page_url = get_next_page_url(current_page_url=start_page_url)
-    except httpx.HTTPError as http_error:
-        return f"HTTP error occurred while fetching {start_page_url}: {http_error}"
-
-    # Write the fetched statistics to the CSV file.
-    csv_object.writerows(hockey_team_stats)
-    if next_page_url is not None:
-        # If a 'Next' page is found, recursively continue scraping.
-        scrape_and_write_stats(
-            start_page_url=next_page_url, csv_object=csv_object)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    # A single client is shared by all the requests so that connections are reused.
+    async with httpx.AsyncClient(http2=True, headers=HEADERS,
+                                 timeout=TIMEOUT, limits=LIMITS) as client:
+        try:
+            # Fetch the first page and learn the total number of pages from it.
+            first_page_stats, first_page_html = await fetch_hockey_stats(
+                client=client, page_url=PAGE_URL_TEMPLATE.format(1), semaphore=semaphore)
+            page_count = get_page_count(parsed_html=first_page_html)
+
+            # The pagination is numeric, so the URLs of the remaining pages are generated
+            # up-front and their hockey team statistics are fetched concurrently.
+            page_urls = [PAGE_URL_TEMPLATE.format(page_num)
+                         for page_num in range(2, page_count + 1)]
+            remaining_pages = await asyncio.gather(*[
+                fetch_hockey_stats(client=client, page_url=page_url, semaphore=semaphore)
+                for page_url in page_urls
+            ])
+        except httpx.HTTPError as http_error:
+            return f"HTTP error occurred while scraping: {http_error}"
+
+    # Write the fetched statistics to the CSV file, preserving the page order.
+    csv_object.writerows(first_page_stats)
+    for hockey_team_stats, _ in remaining_pages:
+        csv_object.writerows(hockey_team_stats)
+    return None
 
 # ========== Web Scraping & Data Load ========== #
 
 
 if __name__ == "__main__":
-    START_PAGE_URL = "https://www.scrapethissite.com/pages/forms/?page_num=1&per_page=100"
     OUTPUT_DIR_PATH = "./data/raw/"
     FILE_NAME = "hockey_teams_raw.csv"
     COLUMN_NAMES = [field.name for field in fields(Hockey)]
@@ -172,15 +195,17 @@ if __name__ == "__main__":
 
     # Open the CSV file for writing and write the header.
     with open(output_file_path, mode='w', encoding="utf-8", newline="") as f:
-        csv_writer = DictWriter(f, fieldnames=COLUMN_NAMES)
-        csv_writer.writeheader()
+        csv_writer = writer(f)
+        csv_writer.writerow(COLUMN_NAMES)
 
         print("Scraping in Progress...")
         start_time = datetime.now()
 
         # Start the scraping process.
-        scrape_and_write_stats(
-            start_page_url=START_PAGE_URL, csv_object=csv_writer)
+        error_message = asyncio.run(
+            scrape_and_write_stats(csv_object=csv_writer))
+        if error_message is not None:
+            print(error_message)
         print("Scraping Completed...")
         end_time = datetime.now()
         scraping_time = end_time - start_time
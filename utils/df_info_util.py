@@ -9,16 +9,22 @@ def dataframe_structure(dataframe: pd.DataFrame) -> dict:
     Returns:
         dict: _description_
     """
+    row_count = len(dataframe)
+    column_count = len(dataframe.columns)
+    total_datapoints = row_count * column_count
+    null_datapoints = dataframe.isnull().sum().sum()
+    memory_usage = dataframe.memory_usage(deep=True)
+
     structure_details = {
         "Dimensions": dataframe.ndim,
-        "Shape": dataframe.shape,
-        "Row Count": len(dataframe),
-        "Column Count": len(dataframe.columns),
-        "Total Datapoints": dataframe.size,
-        "Null Datapoints": dataframe.isnull().sum().sum(),
-        "Non-Null Datapoints": dataframe.notnull().sum().sum(),
-        "Total Memory Usage": dataframe.memory_usage(deep=True).sum(),
-        "Average Memory Usage": dataframe.memory_usage(deep=True).mean().round()
+        "Shape": (row_count, column_count),
+        "Row Count": row_count,
+        "Column Count": column_count,
+        "Total Datapoints": total_datapoints,
+        "Null Datapoints": null_datapoints,
+        "Non-Null Datapoints": total_datapoints - null_datapoints,
+        "Total Memory Usage": memory_usage.sum(),
+        "Average Memory Usage": memory_usage.mean().round()
     }
 
     return structure_details
@@ -27,9 +33,8 @@ def dataframe_structure(dataframe: pd.DataFrame) -> dict:
 def datatype_details(dataframe: pd.DataFrame) -> None:
     """_summary_
     """
-    available_dtypes = list(set([str(dt) for dt in dataframe.dtypes]))
-    for dt in available_dtypes:
-        field_count = dataframe.select_dtypes(dt).dtypes.count()
+    dtype_counts = dataframe.dtypes.astype(str).value_counts()
+    for dt, field_count in dtype_counts.items():
         print(f"There are {field_count} fields with {dt} datatype")
 
 
@@ -43,28 +48,33 @@ def object_fields_count_stats(dataframe: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: _description_
     """
 
-    object_field_count_stats = []
-
-    for col in dataframe.select_dtypes('object').columns:
+    object_columns = dataframe.select_dtypes('object').columns
+    row_count = len(dataframe)
+    object_field_count_stats = {
+        "total_rows": [],
+        "null_rows": [],
+        "not_null_rows": [],
+        "unique_item_count": [],
+        "distinct_item_count": []
+    }
 
-        row_count = len(dataframe)
-        unique_values_count = dataframe[col].nunique()
-        distinct_values_count = (dataframe[col].value_counts() == 1).sum()
-        null_values_count = dataframe[col].isnull().sum()
-        notnull_values_count = dataframe[col].notnull().sum()
+    for col in object_columns:
 
-        count_stats = {
-            "column": col,
-            "total_rows": row_count,
-            "null_rows": null_values_count,
-            "not_null_rows": notnull_values_count,
-            "unique_item_count": unique_values_count,
-            "distinct_item_count": distinct_values_count
-        }
+        # A single value_counts pass yields all the counts of the column
+        value_counts = dataframe[col].value_counts()
+        unique_values_count = len(value_counts)
+        distinct_values_count = (value_counts == 1).sum()
+        notnull_values_count = value_counts.sum()
+        null_values_count = row_count - notnull_values_count
 
-        object_field_count_stats.append(count_stats)
+        object_field_count_stats["total_rows"].append(row_count)
+        object_field_count_stats["null_rows"].append(null_values_count)
+        object_field_count_stats["not_null_rows"].append(notnull_values_count)
+        object_field_count_stats["unique_item_count"].append(unique_values_count)
+        object_field_count_stats["distinct_item_count"].append(distinct_values_count)
 
-    return pd.DataFrame(object_field_count_stats).set_index('column')
+    return pd.DataFrame(object_field_count_stats,
+                        index=pd.Index(object_columns, name='column'))
 
 
 def describe_object_fields(dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -73,30 +83,36 @@ def describe_object_fields(dataframe: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: _description_
     """
-    object_field_stats = []
+    object_columns = dataframe.select_dtypes('object').columns
+    object_field_stats = {
+        "count": [],
+        "unique_values": [],
+        "longest_values": [],
+        "average_length_value": [],
+        "shortest_value": [],
+        "max_value_count": [],
+        "min_value_count": []
+    }
 
-    for col in dataframe.select_dtypes('object').columns:
-        count = dataframe[col].notnull().sum()
+    for col in object_columns:
+        count = dataframe[col].count()
         unique_values = dataframe[col].nunique()
-        longest_value = dataframe[col].str.len().max()
-        average_length_value = round(dataframe[col].str.len().mean(), 1)
-        shortest_value = dataframe[col].str.len().min()
-        max_value_count = (
-            dataframe[col].str.len() == longest_value).sum()
-        min_value_count = (
-            dataframe[col].str.len() == shortest_value).sum()
-
-        summary_stats = {
-            "column": col,
-            "count": count,
-            "unique_values": unique_values,
-            "longest_values": longest_value,
-            "average_length_value": average_length_value,
-            "shortest_value": shortest_value,
-            "max_value_count": max_value_count,
-            "min_value_count": min_value_count
-        }
-
-        object_field_stats.append(summary_stats)
-
-    return pd.DataFrame(object_field_stats).set_index('column')
+
+        # Compute the value lengths once and derive all the length stats from them
+        value_lengths = dataframe[col].str.len()
+        longest_value = value_lengths.max()
+        average_length_value = round(value_lengths.mean(), 1)
+        shortest_value = value_lengths.min()
+        max_value_count = (value_lengths == longest_value).sum()
+        min_value_count = (value_lengths == shortest_value).sum()
+
+        object_field_stats["count"].append(count)
+        object_field_stats["unique_values"].append(unique_values)
+        object_field_stats["longest_values"].append(longest_value)
+        object_field_stats["average_length_value"].append(average_length_value)
+        object_field_stats["shortest_value"].append(shortest_value)
+        object_field_stats["max_value_count"].append(max_value_count)
+        object_field_stats["min_value_count"].append(min_value_count)
+
+    return pd.DataFrame(object_field_stats,
+                        index=pd.Index(object_columns, name='column'))
@@ -22,10 +22,10 @@ def top_n_teams(dataframe: pd.DataFrame, column_name: str,
         pd.DataFrame: A DataFrame containing the top N teams based on the specified aggregation.
     """
     topn_df = (
-        dataframe[["team_name", column_name]]
-        .groupby("team_name")
+        dataframe
+        .groupby("team_name", observed=True)[column_name]
         .agg(agg_func)
-        .nlargest(n=n, columns=column_name)
+        .nlargest(n=n)
         .reset_index()
     )
     return topn_df
@@ -46,10 +46,10 @@ def bottom_n_teams(dataframe: pd.DataFrame, column_name: str,
         pd.DataFrame: A DataFrame containing the top N teams based on the specified aggregation.
     """
     bottom_n_df = (
-        dataframe[["team_name", column_name]]
-        .groupby("team_name")
+        dataframe
+        .groupby("team_name", observed=True)[column_name]
         .agg(agg_func)
-        .nsmallest(n=n, columns=column_name)
+        .nsmallest(n=n)
         .reset_index()
     )
     return bottom_n_df
@@ -77,8 +77,8 @@ def pretty_print_topn_df(dataframe: pd.DataFrame, title: str) -> None:
         table.add_column(col_name, style=style)
 
     # Add rows from the DataFrame
-    for i, row in dataframe.iterrows():
-        table.add_row(str(i), *[str(row[col]) for col in dataframe.columns])
+    for i, *values in dataframe.itertuples(index=True, name=None):
+        table.add_row(str(i), *map(str, values))
 
     # Print the table
     console.print(table)